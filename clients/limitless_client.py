@@ -1,11 +1,16 @@
-from typing import Literal, List
+from typing import Literal, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 import math
-import time
-from decimal import Decimal
+
+from requests import HTTPError
 
 from proxies.limitless_proxy import LimitlessProxy
 from models.marketdata import MarketData
 from models.bba import BBA
+from utils.token_cache import TokenCache
+
+# Shared across clients so each slug is resolved at most once, even across restarts
+_TOKEN_CACHE = TokenCache()
 
 
 class LimitlessClient:
@@ -13,92 +18,107 @@ class LimitlessClient:
     Market = Literal["YES", "NO"]
     Side = Literal["BUY", "SELL"]
 
-    def __init__(self, private_key: str, proxy: LimitlessProxy):
-        self._proxy = proxy
+    # Hardcoded for now, not fetched per market
+    MAX_HALF_SPREAD = 0.03
+    TICK_SIZE = 0.001
+
+    def __init__(self, private_key: str, proxy: Optional[LimitlessProxy] = None):
+        # Pass a shared proxy so all clients use one session, rate limiter and login
+        self._proxy = proxy if proxy is not None else LimitlessProxy(private_key)
+        self._owns_proxy = proxy is None
+        # (price, usd) -> shares; prices sit on a 0.001 tick ladder so this stays small
+        self._shares_cache: dict[tuple[float, float], int] = {}
+
+    def close(self):
+        """Stop the proxy's session refresher, unless the proxy is shared with other clients"""
+        if self._owns_proxy:
+            self._proxy.close()
 
     def get_market_data(self, slug: str):
         if not slug:
             raise ValueError("Slug is required")
 
-        tokens = self._proxy.get_token_ids(slug)
+        tokens = _TOKEN_CACHE.get(slug)
+        if tokens is None:
+            tokens = self._proxy.get_token_ids(slug)
+            _TOKEN_CACHE.put(slug, tokens)
         yes_token_id, no_token_id = tokens['yes'], tokens['no']
 
         market_data = MarketData(slug=slug, yes_token=yes_token_id, no_token=no_token_id)
         return market_data
 
-    def buy_yes(self, price_dollars: float, usd_amount: float, market_data: MarketData):
-        price_dollars = round(price_dollars, 3)
-        shares = math.floor(usd_amount / price_dollars)
+    def _place(self, market_type: Market, side: Side, price_dollars: float, shares: int, market_data: MarketData):
         order = self._proxy.place_order(
             price_dollars=price_dollars,
             shares=shares,
-            market_type='YES',
-            side='BUY',
+            market_type=market_type,
+            side=side,
             market_data=market_data
         )
 
-        if "order" in order and "id" in order["order"]:
-            return order["order"]["id"]
-        else:
+        order_id = order.get("order", {}).get("id")
+        if not order_id:
             raise ValueError("No order returned in response")
+        return order_id
 
-    def buy_no(self, price_dollars: float, usd_amount: float, market_data: MarketData):
-        price_dollars = round(price_dollars, 3)
-        shares = math.floor(usd_amount / price_dollars)
-        order = self._proxy.place_order(
-            price_dollars=price_dollars,
-            shares=shares,
-            market_type='NO',
-            side='BUY',
-            market_data=market_data
-        )
+    def _shares_for(self, price_dollars: float, usd_amount: float) -> int:
+        key = (price_dollars, usd_amount)
+        shares = self._shares_cache.get(key)
+        if shares is None:
+            shares = self._shares_cache[key] = math.floor(usd_amount / price_dollars)
+        return shares
 
-        if "order" in order and "id" in order["order"]:
-            return order["order"]["id"]
-        else:
-            raise ValueError("No order returned in response")
+    def buy_yes(self, price_dollars: float, usd_amount: float, market_data: MarketData):
+        price_dollars = round(price_dollars, 3)
+        return self._place('YES', 'BUY', price_dollars, self._shares_for(price_dollars, usd_amount), market_data)
 
-    def sell_yes(self, price_dollars: float, shares: int, market_data: MarketData):
+    def buy_no(self, price_dollars: float, usd_amount: float, market_data: MarketData):
         price_dollars = round(price_dollars, 3)
-        order = self._proxy.place_order(
-            price_dollars=price_dollars,
-            shares=shares,
-            market_type='YES',
-            side='SELL',
-            market_data=market_data
-        )
+        return self._place('NO', 'BUY', price_dollars, self._shares_for(price_dollars, usd_amount), market_data)
 
-        if "order" in order and "id" in order["order"]:
-            return order["order"]["id"]
-        else:
-            raise ValueError("No order returned in response")
+    def sell_yes(self, price_dollars: float, shares: int, market_data: MarketData):
+        return self._place('YES', 'SELL', round(price_dollars, 3), shares, market_data)
 
     def sell_no(self, price_dollars: float, shares: int, market_data: MarketData):
-        price_dollars = round(price_dollars, 3)
-        order = self._proxy.place_order(
-            price_dollars=price_dollars,
-            shares=shares,
-            market_type='NO',
-            side='SELL',
-            market_data=market_data
-        )
+        return self._place('NO', 'SELL', round(price_dollars, 3), shares, market_data)
+
+    def place_orders(
+        self,
+        orders: List[Tuple[Market, Side, float, float]],
+        market_data: MarketData
+    ) -> List[Union[str, Exception]]:
+        """
+        Place independent orders with their requests in flight together.
+
+        Each order is (market_type, side, price_dollars, size), where size is the USD
+        amount for BUY and the share count for SELL. Returns one result per order, in
+        input order: the order ID, or the exception if that order failed, so a failed
+        leg doesn't hide the IDs of legs that did go through.
+        """
+        if not orders:
+            return []
 
-        if "order" in order and "id" in order["order"]:
-            return order["order"]["id"]
-        else:
-            raise ValueError("No order returned in response")
+        def place(order):
+            market_type, side, price_dollars, size = order
+            method = getattr(self, f"{side.lower()}_{market_type.lower()}")
+            return method(price_dollars, size, market_data)
+
+        with ThreadPoolExecutor(max_workers=len(orders)) as ex:
+            futures = [ex.submit(place, order) for order in orders]
+        return [f.exception() or f.result() for f in futures]
 
     def get_bba(self, market_data: MarketData):
         orderbook = self._proxy.get_orderbook(market_data)
 
-        if 'bids' in orderbook and 'asks' in orderbook:
-            yes_best_bid = orderbook['bids'][0]['price']
-            yes_best_ask = orderbook['asks'][0]['price']
+        if orderbook.bids and orderbook.asks:
+            yes_best_bid = orderbook.bids[0].price
+            yes_best_ask = orderbook.asks[0].price
 
-            no_best_bid = Decimal("1") - Decimal(str(orderbook['asks'][0]['price']))
-            no_best_ask = Decimal("1") - Decimal(str(orderbook['bids'][0]['price']))
+            # Prices are quoted in 0.001 ticks, so rounding the complement is exact
+            no_best_bid = round(1.0 - yes_best_ask, 3)
+            no_best_ask = round(1.0 - yes_best_bid, 3)
 
-            return BBA(yes_best_bid, yes_best_ask, float(no_best_bid), float(no_best_ask))
+            return BBA(yes_best_bid, yes_best_ask, no_best_bid, no_best_ask)
 
         else:
             raise ValueError("No orderbook data returned in response")
@@ -133,32 +153,37 @@ class LimitlessClient:
     def cancel_orders(self, order_ids: list[str]):
         if not order_ids:
             return
-        ret = []
-        for order_id in order_ids:
-            ret.append(self._proxy.cancel_order(order_id))
-        return ret
-
-    # THIS ONLY RETURNS 0.03 RIGHT NOW !
-    def get_max_half_spread(self):
-        return 0.03
-
-    # THIS ONLY RETURNS 0.001 RIGHT NOW !
-    def get_tick_size(self):
-        return 0.001
+        return self._cancel_split(list(order_ids))
+
+    def _cancel_split(self, order_ids: List[str]) -> List[bool]:
+        """
+        Batch cancel, halving a rejected batch so one bad id costs O(log n) extra
+        requests rather than one per order. Single ids go through cancel_order.
+        """
+        if len(order_ids) == 1:
+            return [self._proxy.cancel_order(order_ids[0])]
+        try:
+            if self._proxy.cancel_orders_batch(order_ids):
+                return [True] * len(order_ids)
+        except HTTPError:
+            # Rate limited or server error, not a bad id: halving would only repeat the
+            # failure, so cancel individually with the requests in flight together
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                return list(ex.map(self._proxy.cancel_order, order_ids))
+
+        # Batch rejected, retry both halves with the requests in flight together
+        mid = len(order_ids) // 2
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            left, right = ex.map(self._cancel_split, (order_ids[:mid], order_ids[mid:]))
+        return left + right
 
     def check_orders_filled(self, order_ids: List[str]) -> List[str]:
         """Check if any orders have been filled - returns list of filled order IDs"""
         if not order_ids:
             return []
 
-        filled_orders = []
-
-        for order_id in order_ids:
-            order_data = self._proxy.check_order_filled(order_id)
-            if order_data is not None:
-                filled_orders.append(order_id)
-
-            # Add small delay between order checks
-            time.sleep(0.5)
+        # The proxy's rate limiter paces these, so no sleep between checks
+        with ThreadPoolExecutor(max_workers=min(8, len(order_ids))) as ex:
+            results = list(ex.map(self._proxy.check_order_filled, order_ids))
 
-        return filled_orders
+        return [order_id for order_id, order_data in zip(order_ids, results) if order_data is not None]
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 import os
 from dotenv import load_dotenv
-from models.constants import DEFAULT_LOG_LEVEL, STRATEGY_LOG_LEVEL, INFO_LOG_LEVEL, LOG_FORMAT
+from models.constants import STRATEGY_LOG_LEVEL, INFO_LOG_LEVEL, LOG_FORMAT
 
 load_dotenv()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeribitConfig:
     lower_instrument_earlier: str
     upper_instrument_later: str
@@ -13,14 +13,14 @@ class DeribitConfig:
     upper_instrument_earlier: str
     target_instrument: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrategyConfig:
     market_id: str
     deribit_config: DeribitConfig
     allocation: float
 
-# Strategy configurations
-STRATEGY_CONFIGS = [
+# Strategy configurations (immutable; shared read-only across trading threads)
+STRATEGY_CONFIGS = (
     StrategyConfig(
         market_id="dollarbtc-above-dollar10729842-on-sep-1-1000-utc-1756116049862",
         deribit_config=DeribitConfig(
@@ -53,8 +53,8 @@ STRATEGY_CONFIGS = [
             target_instrument="BTC-1SEP25-111769-C"
         ),
         allocation=50
-    )
-]
+    ),
+)
 
 # Environment settings
 PRIVATE_KEY = os.getenv('PRIVATE_KEY') or ""
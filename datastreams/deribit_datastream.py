@@ -1,9 +1,17 @@
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+import numpy as np
+
+from utils.fast_binary import interp_target
+
+# Shared pool so the four instrument fetches of a poll are in flight at once
+_FETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="deribit-fetch")
+
 
 @dataclass
 class DeribitBinarySnapshot:
@@ -46,6 +54,12 @@ class DeribitDatastream:
         self.upper_instrument_earlier = upper_instrument_earlier
         self.lower_instrument_later = lower_instrument_later
         self.upper_instrument_later = upper_instrument_later
+        self.instruments = [
+            lower_instrument_earlier,
+            upper_instrument_earlier,
+            lower_instrument_later,
+            upper_instrument_later,
+        ]
 
         # Parse target instrument to get strike and expiration
         self.target_strike, self.target_expiration = self._parse_target_instrument(target_instrument)
@@ -85,16 +99,30 @@ class DeribitDatastream:
             self._thread.join(timeout=2)
 
     def update_prices(self) -> None:
-        """Update internal price state (similar to LimitlessDatastream._update_bba)"""
+        """Update internal price state (similar to LimitlessDatastream._update_bba)
+
+        Serves the cached snapshot if it is younger than the poll interval, so repeated
+        calls within a tick (or while the polling thread is running) don't refetch.
+        """
+        if self.last_update is not None and time.time() - self.last_update < self._interval:
+            return
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Fetch a new snapshot unconditionally"""
         snapshot = self._fetch_snapshot()
         if snapshot:
-            self._last_snapshot = snapshot
-            self.lower_strike = snapshot.lower_strike
-            self.upper_strike = snapshot.upper_strike
-            self.lower_price = snapshot.lower_price
-            self.upper_price = snapshot.upper_price
-            self.target_price = snapshot.target_price
-            self.last_update = snapshot.asof
+            self._apply_snapshot(snapshot)
+
+    def _apply_snapshot(self, snapshot: DeribitBinarySnapshot) -> None:
+        """Publish a computed snapshot to the current price attributes"""
+        self._last_snapshot = snapshot
+        self.lower_strike = snapshot.lower_strike
+        self.upper_strike = snapshot.upper_strike
+        self.lower_price = snapshot.lower_price
+        self.upper_price = snapshot.upper_price
+        self.target_price = snapshot.target_price
+        self.last_update = snapshot.asof
 
     def get_snapshot(self) -> Optional[DeribitBinarySnapshot]:
         """Get current binary option snapshot (similar to LimitlessDatastream.get_bba)"""
@@ -110,7 +138,7 @@ class DeribitDatastream:
         """Main polling loop"""
         while not self._stop.is_set():
             try:
-                self.update_prices()
+                self._refresh()
             except Exception:
                 pass  # Continue polling on errors
             finally:
@@ -120,66 +148,27 @@ class DeribitDatastream:
         """Fetch and compute interpolated binary option snapshot"""
         now = time.time()
 
-        # Fetch all 4 instruments
-        lower_earlier_params = self._fetch_params(self.lower_instrument_earlier)
-        upper_earlier_params = self._fetch_params(self.upper_instrument_earlier)
-        lower_later_params = self._fetch_params(self.lower_instrument_later)
-        upper_later_params = self._fetch_params(self.upper_instrument_later)
-
-        # Ensure all params were fetched successfully
-        if None in (lower_earlier_params, upper_earlier_params, lower_later_params, upper_later_params):
-            return None
-
-        # Type narrowing - we know these are not None now
-        assert lower_earlier_params is not None
-        assert upper_earlier_params is not None
-        assert lower_later_params is not None
-        assert upper_later_params is not None
-
-        # Extract binary prices for all 4 instruments
-        binary_prices = [
-            self._compute_binary_price(lower_earlier_params),
-            self._compute_binary_price(upper_earlier_params),
-            self._compute_binary_price(lower_later_params),
-            self._compute_binary_price(upper_later_params)
-        ]
-
-        # Check if any binary price computation failed
-        if any(result[0] is None or result[1] is None for result in binary_prices):
-            return None
+        # Fetch all 4 instruments concurrently
+        futures = [_FETCH_POOL.submit(self._fetch_params, i) for i in self.instruments]
+        params = [f.result() for f in futures]
+        return self._compute_snapshot(params, now)
 
-        # Extract values (we know they're not None due to check above)
-        k_lower_earlier, p_lower_earlier = binary_prices[0]
-        k_upper_earlier, p_upper_earlier = binary_prices[1]
-        k_lower_later, p_lower_later = binary_prices[2]
-        k_upper_later, p_upper_later = binary_prices[3]
-
-        # Type narrowing for all extracted values
-        if None in (k_lower_earlier, p_lower_earlier, k_upper_earlier, p_upper_earlier,
-                   k_lower_later, p_lower_later, k_upper_later, p_upper_later):
+    def _compute_snapshot(
+        self,
+        params: List[Optional[Dict[str, Any]]],
+        now: float
+    ) -> Optional[DeribitBinarySnapshot]:
+        """Compute interpolated binary option snapshot from the four instruments' params"""
+        # Ensure all params were fetched and complete
+        inputs = [self._extract_inputs(p) for p in params]
+        if any(x is None for x in inputs):
             return None
 
-        # Now we can safely assert these are floats
-        assert isinstance(k_lower_earlier, float) and isinstance(p_lower_earlier, float)
-        assert isinstance(k_upper_earlier, float) and isinstance(p_upper_earlier, float)
-        assert isinstance(k_lower_later, float) and isinstance(p_lower_later, float)
-        assert isinstance(k_upper_later, float) and isinstance(p_upper_later, float)
+        S, K, T, r, market_price = (np.array(col, dtype=np.float64) for col in zip(*inputs))
 
-        # Step 1: Interpolate between strikes for each expiration
-        price_earlier = self._interpolate_strike_price(
-            k_lower_earlier, p_lower_earlier, k_upper_earlier, p_upper_earlier
-        )
-        price_later = self._interpolate_strike_price(
-            k_lower_later, p_lower_later, k_upper_later, p_upper_later
-        )
-
-        # Step 2: Get time to expiration for both dates
-        t_earlier = self._safe_get_float(lower_earlier_params, "T", 0.0)
-        t_later = self._safe_get_float(lower_later_params, "T", 0.0)
-
-        # Interpolate between expiration times
-        final_price = self._interpolate_time_price(
-            price_earlier, price_later, t_earlier, t_later, self.target_expiration
+        # Binary prices, strike interpolation and expiration interpolation in one kernel
+        binary_prices, final_price = interp_target(
+            S, K, T, r, market_price, self.target_strike, self.target_expiration
         )
 
         return DeribitBinarySnapshot(
@@ -187,11 +176,11 @@ class DeribitDatastream:
             upper_symbol=self.upper_instrument_earlier,
             target_strike=self.target_strike,
             asof=now,
-            lower_strike=k_lower_earlier,
-            upper_strike=k_upper_earlier,
-            lower_price=p_lower_earlier,
-            upper_price=p_upper_earlier,
-            target_price=final_price,
+            lower_strike=float(K[0]),
+            upper_strike=float(K[1]),
+            lower_price=float(binary_prices[0]),
+            upper_price=float(binary_prices[1]),
+            target_price=float(final_price),
         )
 
     def _parse_target_instrument(self, instrument: str) -> Tuple[float, float]:
@@ -251,45 +240,6 @@ class DeribitDatastream:
         except Exception as e:
             raise ValueError(f"Failed to parse instrument {instrument}: {e}")
 
-    def _interpolate_strike_price(
-        self,
-        k_lower: float,
-        p_lower: float,
-        k_upper: float,
-        p_upper: float
-    ) -> float:
-        """Interpolate price between two strikes for target strike"""
-        if k_lower == k_upper:
-            return (p_lower + p_upper) / 2
-
-        slope = (p_upper - p_lower) / (k_upper - k_lower)
-        return p_lower + slope * (self.target_strike - k_lower)
-
-    def _interpolate_time_price(
-        self,
-        price_earlier: float,
-        price_later: float,
-        t_earlier: float,
-        t_later: float,
-        target_time: float
-    ) -> float:
-        """Interpolate price between two expiration times"""
-        if t_earlier == t_later:
-            return (price_earlier + price_later) / 2
-
-        time_slope = (price_later - price_earlier) / (t_later - t_earlier)
-        return price_earlier + time_slope * (target_time - t_earlier)
-
-    def _safe_get_float(self, params: Optional[Dict[str, Any]], key: str, default: float) -> float:
-        """Safely extract float value from params dictionary"""
-        if params is None:
-            return default
-        try:
-            value = params.get(key, default)
-            return float(value) if value is not None else default
-        except (ValueError, TypeError):
-            return default
-
     def _fetch_params(self, instrument: str) -> Optional[Dict[str, Any]]:
         """Fetch option parameters for an instrument"""
         try:
@@ -298,46 +248,18 @@ class DeribitDatastream:
             return None
 
     @staticmethod
-    def _compute_binary_price(params: Optional[Dict[str, Any]]) -> Tuple[Optional[float], Optional[float]]:
-        """Compute binary option price from option parameters"""
+    def _extract_inputs(params: Optional[Dict[str, Any]]) -> Optional[Tuple[float, float, float, float, float]]:
+        """Extract (S, K, T, r, market_price) as floats from option parameters"""
         if params is None:
-            return None, None
-
+            return None
         try:
-            # Import here to avoid potential circular imports
-            from utils.implied_volatility import find_implied_volatility
-            from utils.create_binary_prices import binary_option_price
-
-            S = params.get("S")
-            K = params.get("K")
-            T = params.get("T")
-            r = params.get("r")
-            market_price = params.get("market_price")
-
-            # Type safety checks - ensure all values are present
-            if None in (S, K, T, r, market_price):
-                return None, None
-
-            # Convert to float with proper error handling
-            try:
-                S_float = float(S) if S is not None else 0.0
-                K_float = float(K) if K is not None else 0.0
-                T_float = float(T) if T is not None else 0.0
-                r_float = float(r) if r is not None else 0.0
-                market_price_float = float(market_price) if market_price is not None else 0.0
-            except (ValueError, TypeError):
-                return None, None
-
-            try:
-                iv = find_implied_volatility(S_float, K_float, T_float, r_float, market_price_float)
-                price = binary_option_price(S_float, K_float, T_float, r_float, iv)
-            except (ValueError, Exception):
-                # Fallback for when IV calculation fails (often near expiry)
-                if S_float > K_float:
-                    price = 0.99  # Very close to 1 but not exactly 1
-                else:
-                    price = 0.01  # Very close to 0 but not exactly 0
-
-            return K_float, float(price)
-        except Exception:
-            return None, None
+            return (
+                float(params["S"]),
+                float(params["K"]),
+                float(params["T"]),
+                float(params["r"]),
+                float(params["market_price"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            # Missing fields or None values
+            return None
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Dict, Any, Tuple
+
+import websockets
+
+from datastreams.deribit_datastream import DeribitDatastream
+from utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+
+class DeribitWsDatastream(DeribitDatastream):
+    """
+    Deribit datastream driven by websocket ticker subscriptions instead of HTTP polling.
+
+    Subscribes to the ticker channel of all four instruments over one connection and
+    recomputes the interpolated snapshot as updates arrive, so staleness is bounded by
+    network latency rather than the poll interval. The asyncio loop runs on a dedicated
+    thread so the synchronous get_snapshot/get_target_price API is unchanged.
+
+    If no ticker update has arrived within the poll interval (not yet connected, or
+    reconnecting), update_prices falls back to the HTTP fetch of DeribitDatastream.
+    """
+
+    WS_MAINNET = "wss://www.deribit.com/ws/api/v2"
+    WS_TESTNET = "wss://test.deribit.com/ws/api/v2"
+
+    # "raw" ticker intervals require an authenticated connection
+    TICKER_INTERVAL = "100ms"
+
+    def __init__(
+        self,
+        lower_instrument_earlier: str,
+        upper_instrument_earlier: str,
+        lower_instrument_later: str,
+        upper_instrument_later: str,
+        target_instrument: str,
+        poll_interval: float = 2.0,
+        testnet: bool = False,
+        timeout: int = 10
+    ):
+        super().__init__(
+            lower_instrument_earlier=lower_instrument_earlier,
+            upper_instrument_earlier=upper_instrument_earlier,
+            lower_instrument_later=lower_instrument_later,
+            upper_instrument_later=upper_instrument_later,
+            target_instrument=target_instrument,
+            poll_interval=poll_interval,
+            testnet=testnet,
+            timeout=timeout
+        )
+        self._ws_url = self.WS_TESTNET if testnet else self.WS_MAINNET
+        self._channels = {
+            f"ticker.{instrument}.{self.TICKER_INTERVAL}": instrument for instrument in self.instruments
+        }
+        # instrument -> (received_at, params), only from the current connection
+        self._ticker_params: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        """Run the websocket listener, reconnecting on errors until stopped"""
+        while not self._stop.is_set():
+            try:
+                asyncio.run(self._listen())
+            except Exception as e:
+                logger.warning(f"Deribit websocket error, reconnecting: {e}")
+            finally:
+                self._stop.wait(self._interval)
+
+    async def _listen(self) -> None:
+        # Tickers from before a disconnect are stale; rebuild from this connection only
+        with self._lock:
+            self._ticker_params.clear()
+
+        # Instrument metadata is static; resolve it before subscribing
+        for instrument in self.instruments:
+            self._fetcher.get_instrument(instrument)
+
+        async with websockets.connect(self._ws_url, ping_interval=20) as ws:
+            await ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "public/subscribe",
+                "params": {"channels": list(self._channels)},
+            }))
+
+            while not self._stop.is_set():
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
+                self._on_message(fast_json.loads(raw))
+
+    def _on_message(self, msg: Dict[str, Any]) -> None:
+        if msg.get("method") != "subscription":
+            if msg.get("error"):
+                raise RuntimeError(f"Subscription error: {msg['error']}")
+            return
+
+        params = msg.get("params", {})
+        instrument = self._channels.get(params.get("channel", ""))
+        if instrument is None:
+            return
+
+        try:
+            option_params = self._fetcher.params_from_ticker(
+                instrument,
+                self._fetcher.get_instrument(instrument),
+                params.get("data", {}),
+                r=0.05,
+                book_fallback=False
+            )
+        except Exception as e:
+            logger.debug(f"Skipping ticker update for {instrument}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._ticker_params[instrument] = (now, option_params)
+            # Publish only once every channel has reported recently; otherwise a silent
+            # channel's old values would be restamped as fresh, and the HTTP fallback covers it
+            entries = [self._ticker_params.get(i) for i in self.instruments]
+            if any(entry is None or now - entry[0] > self._interval for entry in entries):
+                return
+            snapshot = self._compute_snapshot([params for _, params in entries], now)
+            if snapshot:
+                self._apply_snapshot(snapshot)
@@ -8,7 +8,11 @@ class LimitlessDatastream:
     Market = Literal["YES", "NO"] # hardcoded from proxy, probably better way to handle this
 
     def __init__(self, client: LimitlessClient, market_data: MarketData):
-        self.market_data = client.get_market_data(market_data.slug)
+        # Only resolve tokens if the caller didn't already
+        if market_data.yes_token and market_data.no_token:
+            self.market_data = market_data
+        else:
+            self.market_data = client.get_market_data(market_data.slug)
 
         self._client = client
         self.slug = market_data.slug
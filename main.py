@@ -2,49 +2,76 @@ from proxies.limitless_proxy import LimitlessProxy
 from clients.limitless_client import LimitlessClient
 from strategy.reward_farmer import RewardFarmer
 from datastreams.limitless_datastream import LimitlessDatastream
-from datastreams.deribit_datastream import DeribitDatastream
+from datastreams.deribit_ws_datastream import DeribitWsDatastream
 from config.strategy_config import STRATEGY_CONFIGS, PRIVATE_KEY, LOGGING_CONFIG
 from utils.colored_logging import get_market_logger, get_market_name, setup_root_logger
 from eth_account import Account
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import cached_property
 import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 # Configure logging
 setup_root_logger(LOGGING_CONFIG['level'], LOGGING_CONFIG['format'])
 logging.getLogger('strategy.reward_farmer').setLevel(
     getattr(logging, LOGGING_CONFIG['strategy_level'])
 )
 
+def _build_strategy_runtime():
+    """Resolve (config, market_name, market_logger) for each strategy"""
+    runtime = []
+    for i, config in enumerate(STRATEGY_CONFIGS):
+        # Creating the logger registers the market's display name, so it goes first
+        market_logger = get_market_logger(config.market_id, i)
+        # IDs and names are not sys.intern'd: nothing compares them by identity, and they're
+        # resolved once here rather than hashed per tick
+        runtime.append((config, get_market_name(config.market_id), market_logger))
+    return tuple(runtime)
+
+STRATEGY_RUNTIME = _build_strategy_runtime()
+
 class StrategyManager:
     def __init__(self, private_key: str):
-        self.private_key = private_key
-        self.account = Account.from_key(private_key)
-        self.proxy = LimitlessProxy(private_key)
+        self._private_key = private_key
         self.strategies = []
         self.clients = []
         self.limitless_datastreams = []
         self.deribit_datastreams = []
+        self._tick_bundle = []
+        # At least one worker per strategy so a slow market doesn't hold up the others
+        self._pool = ThreadPoolExecutor(max_workers=max(4, len(STRATEGY_CONFIGS)))
+
+    # Deferred until first use: key derivation and the proxy's on-chain approval
+    # check are wasted work if we exit before trading
+    @cached_property
+    def account(self):
+        return Account.from_key(self._private_key)
+
+    @cached_property
+    def proxy(self):
+        return LimitlessProxy(self._private_key)
 
     def initialize_strategies(self):
         """Initialize all strategies from configuration"""
-        for i, config in enumerate(STRATEGY_CONFIGS):
-            market_logger = get_market_logger(config.market_id, i)
-            market_name = get_market_name(config.market_id)
+        for config, market_name, market_logger in STRATEGY_RUNTIME:
             print(f"Initializing {market_name}: {config.market_id}")
 
             # Create client
-            client = LimitlessClient(self.private_key, self.proxy)
+            client = LimitlessClient(self._private_key, self.proxy)
             market_data = client.get_market_data(config.market_id)
 
             # Create datastreams
             limitless_datastream = LimitlessDatastream(client, market_data)
-            deribit_datastream = DeribitDatastream(
+            deribit_datastream = DeribitWsDatastream(
                 lower_instrument_earlier=config.deribit_config.lower_instrument_earlier,
                 upper_instrument_later=config.deribit_config.upper_instrument_later,
                 lower_instrument_later=config.deribit_config.lower_instrument_later,
                 upper_instrument_earlier=config.deribit_config.upper_instrument_earlier,
                 target_instrument=config.deribit_config.target_instrument
             )
+            deribit_datastream.start()
 
             # Create strategy with custom logger
             strategy = RewardFarmer(
@@ -64,29 +91,34 @@ class StrategyManager:
 
             print(f"{market_name} initialized successfully")
 
+        # Built once so the trading loop doesn't re-zip or re-resolve names every tick
+        self._tick_bundle = [
+            (strategy, deribit_ds, limitless_ds, market_name)
+            for strategy, deribit_ds, limitless_ds, (_, market_name, _) in zip(
+                self.strategies, self.deribit_datastreams, self.limitless_datastreams, STRATEGY_RUNTIME
+            )
+        ]
+
     def run_trading_loop(self):
         """Main trading loop for all strategies"""
         print("Starting trading loop...")
 
         while True:
             try:
-                for i, (strategy, deribit_ds, limitless_ds, config) in enumerate(
-                    zip(self.strategies, self.deribit_datastreams, self.limitless_datastreams, STRATEGY_CONFIGS)
-                ):
-                    market_name = get_market_name(config.market_id)
-                    print(f"Running {market_name}...")
-
-                    # Update data streams
-                    deribit_ds.update_prices()
-                    limitless_ds.update_bba()
-
-                    # Execute trading logic
-                    strategy.trading_loop()
-
-                    print(f"Finished {market_name} loop")
-
-                print("Finished all strategies")
-                print("-" * 50)
+                futures = [
+                    self._pool.submit(self._run_one_tick, strategy, deribit_ds, limitless_ds, market_name)
+                    for strategy, deribit_ds, limitless_ds, market_name in self._tick_bundle
+                ]
+                # Let every tick finish before handling errors, so a strategy is never
+                # resubmitted while its previous trading_loop is still running
+                wait(futures)
+                errors = [e for e in (future.exception() for future in futures) if e is not None]
+                for e in errors[1:]:
+                    logging.error(f"Trading loop error: {e}")
+                if errors:
+                    raise errors[0]
+
+                logger.debug("Finished all strategies")
 
             except KeyboardInterrupt:
                 print("Trading loop interrupted by user")
@@ -96,14 +128,33 @@ class StrategyManager:
                 logging.error(f"Trading loop error: {e}")
                 time.sleep(5)  # Wait before retrying
 
+        self._pool.shutdown(wait=False)
+
+    def close(self):
+        """Stop the proxy's background session refresher, if the proxy was ever built"""
+        if "proxy" in self.__dict__:
+            self.proxy.close()
+
+    def _run_one_tick(self, strategy, deribit_ds, limitless_ds, market_name):
+        """Update data streams and run one trading iteration for a single strategy"""
+        logger.debug("Running %s", market_name)
+
+        # Update data streams
+        deribit_ds.update_prices()
+        limitless_ds.update_bba()
+
+        # Execute trading logic
+        strategy.trading_loop()
+
+        logger.debug("Finished %s loop", market_name)
+
     def get_positions_summary(self):
         """Get position summary for all strategies"""
         print("\nPosition Summary:")
         print("=" * 60)
 
-        for i, (client, config) in enumerate(zip(self.clients, STRATEGY_CONFIGS)):
+        for client, (_, market_name, _) in zip(self.clients, STRATEGY_RUNTIME):
             try:
-                market_name = get_market_name(config.market_id)
                 market_data = client.market_data if hasattr(client, 'market_data') else None
                 if market_data:
                     yes_shares, no_shares = client.get_position(market_data)
@@ -112,7 +163,6 @@ class StrategyManager:
                     print(f"  NO shares: {no_shares}")
                     print("-" * 40)
             except Exception as e:
-                market_name = get_market_name(config.market_id)
                 print(f"  Error getting position for {market_name}: {e}")
 
 def main():
@@ -141,6 +191,7 @@ def main():
     finally:
         # Get final position summary
         manager.get_positions_summary()
+        manager.close()
         print("Trading system shutdown complete")
 
 if __name__ == "__main__":
@@ -3,13 +3,26 @@ Constants for the Limitless Market Maker application.
 Contains all configuration constants, URLs, addresses, and other constant values.
 """
 
+import os
+
 # Limitless Exchange Configuration
+# Contract addresses are kept in EIP-55 checksummed form so they can be passed to Web3 as-is
 LIMITLESS_URL = "https://api.limitless.exchange"
 LIMITLESS_CLOB_CFT_ADDRS = "0xa4409D988CA2218d956BeEFD3874100F444f0DC3"
 LIMITLESS_NEGRISK_CFT_ADDRS = "0x5a38afc17F7E97ad8d6C547ddb837E40B4aEDfC6"
 LIMITLESS_ERC1155_CFT_ADDRS = "0xC9c98965297Bc527861c898329Ee280632B76e18"
 LIMITLESS_OPERATOR_CTF_ADDRS = "0xa4409D988CA2218d956BeEFD3874100F444f0DC3"
 
+# Local cache of slug -> token ids
+TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/limitless/tokens.json")
+
+# Local record of confirmed CTF operator approvals, trusted for a day before re-checking on-chain
+APPROVAL_CACHE_PATH = os.path.expanduser("~/.cache/limitless/approvals.json")
+APPROVAL_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Login sessions, one file per account, reused across restarts until the cookie expires
+SESSION_CACHE_DIR = os.path.expanduser("~/.cache/limitless/sessions")
+
 # Base Network Configuration
 BASE_RPC = "https://mainnet.base.org"
 BASE_CHAIN_ID = 8453
@@ -21,6 +34,7 @@ MAX_SLIPPAGE = 0.05  # 5%
 
 # API Rate Limits
 LIMITLESS_RATE_LIMIT = 10  # requests per second
+LIMITLESS_RATE_BURST = 4   # lets a full set of order legs go out together
 DERIBIT_RATE_LIMIT = 5    # requests per second
 
 # Retry Configuration
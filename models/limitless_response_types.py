@@ -1,18 +1,19 @@
-from typing import TypedDict, NotRequired, Literal, List, Union, Dict, Any
+from __future__ import annotations
+
+from typing import TypedDict, Literal, List, Optional, Union, Dict, Any
+
+import msgspec
 
 # --- GET /markets/{slug}/orderbook ---
-class OBLevel(TypedDict):
+# Polled every tick, so decoded straight into structs (see LimitlessProxy.get_orderbook).
+# Only the fields get_bba reads are declared; msgspec skips the rest, so their types can't fail a tick
+class OBLevel(msgspec.Struct, frozen=True):
     price: float
-    size: int
+    size: float = 0.0
 
-class OrderbookDTO(TypedDict, total=False):
-    adjustedMidpoint: float
-    asks: List[OBLevel]
-    bids: List[OBLevel]
-    lastTradePrice: float
-    maxSpread: float
-    minSize: int
-    tokenId: str
+class OrderbookDTO(msgspec.Struct, frozen=True):
+    asks: Optional[List[OBLevel]] = None
+    bids: Optional[List[OBLevel]] = None
 
 # --- POST /orders (request body) ---
 class OrderDTO(TypedDict, total=False):
@@ -39,15 +40,11 @@ class CreateOrderBodyDTO(TypedDict):
     marketSlug: str
 
 # --- POST /orders (response) ---
-class MatchDTO(TypedDict, total=False):
-    # API example shows [] — keep flexible
-    # Fill in if you later rely on specific fields
-    pass
-
 class CreateOrderResponseDTO(TypedDict, total=False):
     order: OrderDTO
-    makerMatches: List[MatchDTO]
-    takerMatches: NotRequired[List[MatchDTO]]
+    # API example shows [] for matches; type them if we start relying on fields
+    makerMatches: List[Dict[str, Any]]
+    takerMatches: List[Dict[str, Any]]
 
 # --- rewardsChartData item ---
 class RewardsChartDataDTO(TypedDict, total=False):
@@ -1,22 +1,32 @@
 from dotenv import load_dotenv
-from typing import Literal, Optional, NamedTuple, Tuple, get_args
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Literal, Optional, Tuple
 from web3 import Web3
 from eth_account import Account
 from eth_account.messages import encode_defunct, encode_typed_data
+from eth_abi import encode as abi_encode
+from eth_utils import keccak
+from eth_keys import keys
+import msgspec
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
+from email.utils import parsedate_to_datetime
 import logging
-import json
-from decimal import Decimal
-import math
 import random
 
-from utils.rate_limit import SpacedLimiter
+from utils.rate_limit import TokenBucket
 from utils.string_to_hex import string_to_hex
+from utils import fast_json
+from utils.approval_cache import ApprovalCache
+from utils.session_cache import SessionCache
 from models.constants import (
     LIMITLESS_URL, BASE_RPC, LIMITLESS_CLOB_CFT_ADDRS,
     LIMITLESS_NEGRISK_CFT_ADDRS, LIMITLESS_ERC1155_CFT_ADDRS,
-    LIMITLESS_OPERATOR_CTF_ADDRS, BASE_CHAIN_ID
+    LIMITLESS_OPERATOR_CTF_ADDRS, BASE_CHAIN_ID,
+    LIMITLESS_RATE_LIMIT, LIMITLESS_RATE_BURST
 )
 from models.marketdata import MarketData
 from models.limitless_response_types import (
@@ -30,6 +40,71 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Longest server-requested wait we honor; anything beyond is likely a bad header
+_MAX_SERVER_BACKOFF_S = 60.0
+
+# Connection-error retries for the pooled adapter; Retry is immutable, so one instance serves every session.
+# urllib3 would otherwise retry 413/429/503 carrying Retry-After itself, sleeping inside the
+# session where the limiters can't see it; _gated_request owns all status retries
+_CONNECT_RETRY = Retry(total=3, backoff_factor=0.2, respect_retry_after_header=False)
+
+# (connect, read): a stalled TLS handshake fails fast, the server still gets 35s to answer
+_HTTP_TIMEOUT = (3.05, 35)
+
+# Salts are millisecond timestamps this far ahead
+_ONE_DAY_MS = 86_400_000
+
+# Order taker for open orders
+_ZERO_ADDR = "0x0000000000000000000000000000000000000000"
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), if present"""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), _MAX_SERVER_BACKOFF_S)
+
+
+def _rate_limit_reset_seconds(headers) -> Optional[float]:
+    """Seconds until the rate limit window resets, from RateLimit-Reset / X-RateLimit-Reset"""
+    value = headers.get("RateLimit-Reset") or headers.get("X-RateLimit-Reset")
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Some APIs send an epoch timestamp rather than a delta
+    if reset > 1e9:
+        reset -= time.time()
+    return min(max(reset, 0.0), _MAX_SERVER_BACKOFF_S)
+
+
+# Shared so a restart within the TTL skips the on-chain approval check entirely
+_APPROVAL_CACHE = ApprovalCache()
+_SESSION_CACHE = SessionCache()
+
+# One Web3 provider (and its HTTP connection pool) for every proxy instance
+_W3: Optional[Web3] = None
+_W3_LOCK = threading.Lock()
+
+
+def _shared_w3() -> Web3:
+    global _W3
+    with _W3_LOCK:
+        if _W3 is None:
+            _W3 = Web3(Web3.HTTPProvider(BASE_RPC))
+        return _W3
+
+
 class LimitlessProxy:
     _EIP712_ORDER_TYPES = {
         "Order": [
@@ -48,6 +123,13 @@ class LimitlessProxy:
         ]
     }
 
+    # EIP-712 hashing pieces that never change, so signing only hashes the order itself
+    _ORDER_FIELD_NAMES = tuple(f["name"] for f in _EIP712_ORDER_TYPES["Order"])
+    _ORDER_FIELD_TYPES = tuple(f["type"] for f in _EIP712_ORDER_TYPES["Order"])
+    _ORDER_FIELD_IS_ADDRESS = tuple(t == "address" for t in _ORDER_FIELD_TYPES)
+    _ORDER_TYPEHASH = keccak(text="Order(" + ",".join(f"{f['type']} {f['name']}" for f in _EIP712_ORDER_TYPES["Order"]) + ")")
+    _DOMAIN_TYPEHASH = keccak(text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+
     _ERC1155_ABI = [
         {"constant": False, "inputs": [
             {"name": "operator", "type": "address"},
@@ -63,62 +145,164 @@ class LimitlessProxy:
     Market = Literal["YES", "NO"]
     Side = Literal["BUY", "SELL"]
 
-    class LoginSession(NamedTuple):
+    # Collateral (USDC) and outcome tokens both use 6 decimals
+    _SCALING_FACTOR = 10 ** 6
+
+    # Each endpoint class gets its own bucket so polling can't starve order placement.
+    # Logins are rare (two calls per session), so auth gets a small fixed slice and
+    # writes and reads split the rest of the API quota
+    _AUTH_RATE_PER_S = 1.0
+    _AUTH_BURST = 2
+
+    _JSON_HEADERS = {
+        "Content-Type": "application/json",
+    }
+
+    @dataclass(frozen=True, slots=True)
+    class LoginSession:
         ts: float
         cookie: str
         user_data: dict
+        user_id: int
+        fee_rate_bps: int
+        expires_at: float
 
-    class SignedMessage(NamedTuple):
+    @dataclass(frozen=True, slots=True)
+    class SignedMessage:
         ts: float
         message: str
+        max_age: float
+
+    # The signing message isn't tied to an account, so every proxy for the same API
+    # shares one, and only one of them fetches it when it expires
+    _SIGNING_MESSAGE_CACHE: Dict[str, "LimitlessProxy.SignedMessage"] = {}
+    _SIGNING_MESSAGE_LOCK = threading.Lock()
+
+    # Used when the session cookie carries no expiry; refresh this long before it lapses
+    _DEFAULT_SESSION_TTL_S = 60
+    _SESSION_EXPIRY_MARGIN_S = 30
+    # The background refresher logs in again this long before _get_session would
+    _SESSION_REFRESH_LEAD_S = 5
 
     def __init__(self, private_key):
         self._logger = logger.getChild(__class__.__name__)
-        self._limiter = SpacedLimiter(min_interval_s=3)
+        shared_rate = (LIMITLESS_RATE_LIMIT - self._AUTH_RATE_PER_S) / 2
+        self._limiters = {
+            "auth": TokenBucket(rate_per_s=self._AUTH_RATE_PER_S, burst=self._AUTH_BURST),
+            "write": TokenBucket(rate_per_s=shared_rate, burst=LIMITLESS_RATE_BURST),
+            "read": TokenBucket(rate_per_s=shared_rate, burst=LIMITLESS_RATE_BURST),
+        }
+
+        # One pooled keep-alive session so calls reuse TCP+TLS connections.
+        # The adapter only retries connection errors; status retries stay in _gated_request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=_CONNECT_RETRY
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Every Limitless endpoint speaks JSON, so set it once rather than per call
+        self._session.headers.update({"Accept": "application/json"})
 
         if not private_key:
             raise ValueError("Private key is required")
 
         self._account = Account.from_key(private_key)
+        # Sign order digests with the eth_keys key directly, skipping the LocalAccount wrappers
+        self._key_obj = keys.PrivateKey(self._account.key)
         self._private_key: str = private_key
         self._public_key: str = self._account.address
         self._api_url: str = LIMITLESS_URL
 
-        # Use checksume since Web3 package checks validity of address by verifying if valid checksum
-        self._clob_address = Web3.to_checksum_address(LIMITLESS_CLOB_CFT_ADDRS)
-        self._negrisk_address = Web3.to_checksum_address(LIMITLESS_NEGRISK_CFT_ADDRS)
-        self._ctf_erc1155_addr = Web3.to_checksum_address(LIMITLESS_ERC1155_CFT_ADDRS)
-        self._operator_ctf_addr = Web3.to_checksum_address(LIMITLESS_OPERATOR_CTF_ADDRS)
+        # Constants are stored checksummed, which Web3 requires for address validity
+        self._clob_address = LIMITLESS_CLOB_CFT_ADDRS
+        self._negrisk_address = LIMITLESS_NEGRISK_CFT_ADDRS
+        self._ctf_erc1155_addr = LIMITLESS_ERC1155_CFT_ADDRS
+        self._operator_ctf_addr = LIMITLESS_OPERATOR_CTF_ADDRS
 
         self._rpc: str = BASE_RPC
         self._chain_id: int = BASE_CHAIN_ID
-        self._w3 = Web3(Web3.HTTPProvider(BASE_RPC))
+
+        self._salt_lock = threading.Lock()
+        self._last_salt = 0
+
+        self._eip712_domain = {
+            'name': 'Limitless CTF Exchange',
+            'version': '1',
+            'chainId': self._chain_id,
+            'verifyingContract': self._clob_address
+        }
+        self._domain_separator = keccak(self._DOMAIN_TYPEHASH + abi_encode(
+            ["bytes32", "bytes32", "uint256", "address"],
+            [
+                keccak(text=self._eip712_domain['name']),
+                keccak(text=self._eip712_domain['version']),
+                self._chain_id,
+                self._clob_address,
+            ]
+        ))
+        self._verify_order_hashing()
+        self._w3 = _shared_w3()
+
+        # Parse the ABI and resolve the function handles once
+        self._ctf = self._w3.eth.contract(address=self._ctf_erc1155_addr, abi=self._ERC1155_ABI)
+        self._fn_is_approved_for_all = self._ctf.functions.isApprovedForAll
+        self._fn_set_approval_for_all = self._ctf.functions.setApprovalForAll
         self._ensure_ctf_sell_approval(self._private_key)
 
-        self._signed_message_cache: Optional[LimitlessProxy.SignedMessage] = None
-        self._login_cache: Optional[LimitlessProxy.LoginSession] = None
+        self._login_cache: Optional[LimitlessProxy.LoginSession] = self._load_cache_from_disk()
+        # Orders go out concurrently; only one of them should refresh the session
+        self._auth_lock = threading.Lock()
+        self._closed = threading.Event()
+        threading.Thread(target=self._refresh_session_loop, name="limitless-session-refresh", daemon=True).start()
 
     def __repr__(self):
         return f"LimitlessProxy(public_key={self._public_key!r})"
 
+    def close(self):
+        """Stop the background session refresher"""
+        self._closed.set()
+
+    @staticmethod
+    def _endpoint_class(method: str, path: str) -> str:
+        if path.startswith("/auth/"):
+            return "auth"
+        # By method, not path: fill checks (GET /orders/{id}) mustn't drain the bucket
+        # that placement and cancels need
+        return "read" if method == "GET" else "write"
+
     def _gated_request(self, method: str, path: str, **kwargs) -> requests.Response:
         base = self._api_url.rstrip("/")
         url = f"{base}{path}"
+        limiter = self._limiters[self._endpoint_class(method, path)]
 
         for attempt in range(4):
-            self._limiter.acquire()
-            r = requests.request(method, url, timeout=35, **kwargs)
+            limiter.acquire()
+            r = self._session.request(method, url, timeout=_HTTP_TIMEOUT, **kwargs)
 
             # retry only when it's likely transient
             if r.status_code in (429, 500, 502, 503, 504):
-                backoff = min(2 ** attempt, 8) + random.random() * 0.4
-                time.sleep(backoff)
+                retry_after = _retry_after_seconds(r.headers)
+                if retry_after is not None:
+                    # The server said how long; pause the whole endpoint class, not just this call
+                    limiter.pause(retry_after + random.random() * 0.2)
+                else:
+                    backoff = min(2 ** attempt, 8) + random.random() * 0.4
+                    time.sleep(backoff)
                 continue
 
+            # Out of quota: wait for the reset before the next call rather than eat a 429
+            if r.headers.get("X-RateLimit-Remaining") == "0":
+                reset = _rate_limit_reset_seconds(r.headers)
+                if reset is not None:
+                    limiter.pause(reset)
+
             return r
 
-        self._limiter.acquire()
-        r = requests.request(method, url, timeout=35, **kwargs)
+        limiter.acquire()
+        r = self._session.request(method, url, timeout=_HTTP_TIMEOUT, **kwargs)
         return r
 
     def _gated_get(self, path: str, **kwargs):  return self._gated_request("GET", path, **kwargs)
@@ -127,30 +311,62 @@ class LimitlessProxy:
 
     def _gated_delete(self, path: str, **kwargs): return self._gated_request("DELETE", path, **kwargs)
 
+    def _authed_request(self, method: str, path: str, headers: Optional[dict] = None, **kwargs) -> requests.Response:
+        """Gated request with the session cookie; a 401 drops the session and retries once with a new login"""
+        for attempt in range(2):
+            session = self._get_session()
+            r = self._gated_request(
+                method, path, headers={**(headers or {}), "cookie": f"limitless_session={session.cookie}"}, **kwargs
+            )
+            if r.status_code != 401 or attempt:
+                return r
+            self._logger.info("Session rejected with 401, logging in again")
+            self._invalidate_session(session)
+        return r
+
+    def _invalidate_session(self, session: "LimitlessProxy.LoginSession"):
+        with self._auth_lock:
+            # Another thread may already have replaced it
+            if self._login_cache is session:
+                self._login_cache = None
+                _SESSION_CACHE.delete(self._public_key)
+        with self._SIGNING_MESSAGE_LOCK:
+            self._SIGNING_MESSAGE_CACHE.pop(self._api_url, None)
+
     def _ensure_ctf_sell_approval(self, private_key: str):
-        public_key = Web3.to_checksum_address(self._account.address)
+        public_key = self._account.address  # already checksummed
         operator = self._operator_ctf_addr
-        ctf = self._w3.eth.contract(address=self._ctf_erc1155_addr, abi=self._ERC1155_ABI)
+        if _APPROVAL_CACHE.is_fresh(public_key, operator):
+            self._logger.debug(f"CTF approval for operator {operator} recently confirmed, skipping check")
+            return
 
+        set_approval = self._fn_set_approval_for_all(operator, True)
 
+        # Approval state and nonce go out as one JSON-RPC batch. Gas is only estimated once we
+        # know a tx is needed, so a failing estimate can't block an already-approved wallet
         try:
-            already_approved = ctf.functions.isApprovedForAll(public_key, operator).call({"from": public_key})
+            with self._w3.batch_requests() as batch:
+                batch.add(self._fn_is_approved_for_all(public_key, operator))
+                batch.add(self._w3.eth.get_transaction_count(public_key))
+                already_approved, nonce = batch.execute()
         except Exception as e:
-            self._logger.warning(f"isApprovedForAll({operator}) view failed (continuing):", e)
-            already_approved = False
+            self._logger.warning(f"Batched approval reads failed, retrying individually: {e}")
+            already_approved, nonce = self._approval_reads(public_key, operator)
 
         if already_approved:
             self._logger.info(f"Already approved CTF for transfer to operator: {operator}")
+            _APPROVAL_CACHE.mark(public_key, operator)
+            return
 
         try:
-            gas_est = ctf.functions.setApprovalForAll(operator, True).estimate_gas({"from": public_key})
-            print(f"approval gas estimate for {operator}: {gas_est}")
+            gas_est = set_approval.estimate_gas({"from": public_key})
         except Exception as eg:
             raise RuntimeError(f"❌ setApprovalForAll would revert for operator {operator}: {eg}")
+        self._logger.debug("approval gas estimate for %s: %s", operator, gas_est)
 
-        tx = ctf.functions.setApprovalForAll(operator, True).build_transaction({
+        tx = set_approval.build_transaction({
             "from": public_key,
-            "nonce": self._w3.eth.get_transaction_count(public_key),
+            "nonce": nonce,
             "maxFeePerGas": self._w3.to_wei("0.5", "gwei"),
             "maxPriorityFeePerGas": self._w3.to_wei("0.1", "gwei"),
             "gas": int(gas_est * 1.2),
@@ -163,30 +379,40 @@ class LimitlessProxy:
         if rcpt.status != 1: # pyright: ignore
             raise RuntimeError(f"❌ setApprovalForAll failed on-chain for operator {operator}")
         self._logger.info(f"ERC1155 approval confirmed for operator {operator}")
+        _APPROVAL_CACHE.mark(public_key, operator)
 
-    def _get_signing_message(self):
-        now = time.time()
-        max_cache_age = 60
-        if self._signed_message_cache and self._signed_message_cache.ts + max_cache_age > now:
-            self._logger.debug(f"Using cached signing message {self._signed_message_cache}")
-            return self._signed_message_cache.message
+    def _approval_reads(self, public_key: str, operator: str) -> Tuple[bool, Optional[int]]:
+        """Unbatched (approved, nonce) reads, for RPCs that reject or fail a batch; no nonce if approved"""
+        try:
+            already_approved = self._fn_is_approved_for_all(public_key, operator).call({"from": public_key})
+        except Exception as e:
+            self._logger.warning(f"isApprovedForAll({operator}) view failed (continuing): {e}")
+            already_approved = False
 
-        r = self._gated_get('/auth/signing-message')
-        if r.status_code != 200:
-            raise Exception(f"Failed to get signing message: {r.text}")
-        self._signed_message_cache = self.SignedMessage(ts=now, message=r.text)
-        self._login_cache = None # force new login
-        self._logger.debug(f'Set signed_message_cache {self._signed_message_cache}')
-        return r.text
+        if already_approved:
+            return True, None
+        return False, self._w3.eth.get_transaction_count(public_key)
 
-    def _login(self, signing_message: str):
+    def _get_signing_message(self):
+        with self._SIGNING_MESSAGE_LOCK:
+            now = time.time()
+            cached = self._SIGNING_MESSAGE_CACHE.get(self._api_url)
+            if cached and cached.ts + cached.max_age > now:
+                self._logger.debug(f"Using cached signing message {cached}")
+                return cached.message
+
+            r = self._gated_get('/auth/signing-message')
+            if r.status_code != 200:
+                raise Exception(f"Failed to get signing message: {r.text}")
+            # Jitter the TTL so proxies don't all refetch on the same boundary
+            cached = self.SignedMessage(ts=now, message=r.text, max_age=60 + random.uniform(-6, 6))
+            self._SIGNING_MESSAGE_CACHE[self._api_url] = cached
+
+        self._logger.debug(f'Set signing message cache {cached}')
+        return cached.message
+
+    def _login(self, signing_message: str) -> "LimitlessProxy.LoginSession":
         now = time.time()
-        max_cache_age = 60
-
-        if self._login_cache and self._login_cache.ts + max_cache_age > now:
-            self._logger.debug("Using cached login session")
-            return self._login_cache.cookie, self._login_cache.user_data
-
         self._logger.debug(f'Using account {self._account.address}')
 
         signing_message_hash = encode_defunct(text=signing_message)
@@ -196,14 +422,13 @@ class LimitlessProxy:
         signing_message = string_to_hex(signing_message)
 
         headers = {
+            **self._JSON_HEADERS,
             'x-account': self._account.address,
             'x-signature': signature,
             'x-signing-message': signing_message,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
         }
         body = {"client": "eoa"}
-        r = self._gated_post('/auth/login', headers=headers, json=body)
+        r = self._gated_post('/auth/login', headers=headers, data=fast_json.dumps(body))
         if r.status_code != 200:
             raise Exception(f"Authentication failed: {r.status_code} - {r.text}")
         self._logger.debug(f'Logged in successfully: {r.text}')
@@ -211,18 +436,78 @@ class LimitlessProxy:
         cookie = r.cookies.get("limitless_session")
         if not cookie:
             raise Exception("Failed to retrieve session cookie")
-        user_data = r.json()
-        self._login_cache = self.LoginSession(ts=now, cookie=cookie, user_data=user_data)
+        expires = next((c.expires for c in r.cookies if c.name == "limitless_session"), None)
+        expires_at = float(expires) if expires else now + self._DEFAULT_SESSION_TTL_S
+        user_data = fast_json.loads(r.content)
+        # Resolved once per login rather than on every order
+        fee_rate_bps = int((user_data.get("rank") or {}).get("feeRateBps", 0))
+        self._login_cache = self.LoginSession(
+            ts=now, cookie=cookie, user_data=user_data, user_id=user_data["id"],
+            fee_rate_bps=fee_rate_bps, expires_at=expires_at
+        )
+        self._logger.debug(f"Session valid for {expires_at - now:.0f}s")
+        _SESSION_CACHE.save(self._public_key, asdict(self._login_cache))
 
-        return cookie, user_data
+        return self._login_cache
+
+    def _load_cache_from_disk(self) -> Optional["LimitlessProxy.LoginSession"]:
+        data = _SESSION_CACHE.load(self._public_key)
+        if data is None:
+            return None
+        try:
+            session = self.LoginSession(**data)
+        except TypeError:
+            return None
+        if not self._session_is_live(session):
+            return None
+        self._logger.debug("Reusing login session from disk")
+        return session
+
+    def _refresh_session_loop(self):
+        """Log in again shortly before the session lapses, so orders never pay for the login inline"""
+        while not self._closed.is_set():
+            try:
+                session = self._get_session()
+                refresh_at = session.expires_at - self._SESSION_EXPIRY_MARGIN_S - self._SESSION_REFRESH_LEAD_S
+                # Floor the wait so a short-lived cookie can't turn this into a login loop
+                if self._closed.wait(max(refresh_at - time.time(), self._SESSION_REFRESH_LEAD_S)):
+                    return
+                with self._auth_lock:
+                    # Skip if a caller already replaced or invalidated it
+                    if self._login_cache is session:
+                        self._login(self._get_signing_message())
+            except Exception as e:
+                self._logger.warning(f"Background session refresh failed: {e}")
+                self._closed.wait(self._SESSION_REFRESH_LEAD_S)
+
+    def _session_is_live(self, session: Optional["LimitlessProxy.LoginSession"]) -> bool:
+        # Wall clock, not monotonic: expires_at comes from the cookie and survives restarts on disk
+        return session is not None and time.time() < session.expires_at - self._SESSION_EXPIRY_MARGIN_S
+
+    def _get_session(self) -> "LimitlessProxy.LoginSession":
+        # Sessions are frozen and published by plain assignment, so a live one is returned
+        # without the lock, and callers don't queue behind a background refresh
+        cached = self._login_cache
+        if self._session_is_live(cached):
+            return cached
+        with self._auth_lock:
+            # The signing message is only needed to log in, so a live session skips both round-trips
+            cached = self._login_cache
+            if self._session_is_live(cached):
+                return cached
+            signing_message = self._get_signing_message()
+            return self._login(signing_message)
 
     def _get_eip712_order_domain(self):
-        return {
-            'name': 'Limitless CTF Exchange',
-            'version': '1',
-            'chainId': self._chain_id,
-            'verifyingContract': self._clob_address
-        }
+        return self._eip712_domain
+
+    def _next_salt(self) -> int:
+        # Millisecond timestamp a day ahead, bumped when orders are built in the
+        # same millisecond so salts stay unique per maker under concurrent placement
+        with self._salt_lock:
+            salt = max(time.time_ns() // 1_000_000 + _ONE_DAY_MS, self._last_salt + 1)
+            self._last_salt = salt
+            return salt
 
     def _create_order_payload_without_signature(
         self,
@@ -231,20 +516,14 @@ class LimitlessProxy:
         maker_amount,
         taker_amount,
         fee_rate_bps,
-        side
+        side_flag: int
     ) -> OrderDTO :
-        salt = int(time.time() * 1000) + (24 * 60 * 60 * 1000)
-        if side == 'BUY':
-            side_flag = 0
-        elif side == 'SELL':
-            side_flag = 1
-        else:
-            raise ValueError("Invalid side")
+        salt = self._next_salt()
         return {
             "salt":         salt,
             "maker":        maker_address,
             "signer":       maker_address,
-            "taker":        "0x0000000000000000000000000000000000000000",  # open
+            "taker":        _ZERO_ADDR,     # open
             "tokenId":      str(token_id),  # string for API
             "makerAmount":  maker_amount,
             "takerAmount":  taker_amount,
@@ -255,52 +534,72 @@ class LimitlessProxy:
             "signatureType": 0,             # 0 = EOA
         }
 
-    def _create_signature_for_order_payload(self, order_payload) -> str:
-        """Create EIP-712 signature for order (from fixing_sell.py)"""
-        msg = dict(order_payload)
-        msg["tokenId"]    = int(msg["tokenId"])
-        msg["expiration"] = int(msg["expiration"])
-
-
-        domain = self._get_eip712_order_domain()
+    def _order_struct_hash(self, order_payload) -> bytes:
+        # Every Order field is a static 32-byte word, so encode them directly instead of through
+        # eth_abi's generic encoders (~5us vs ~80us); _verify_order_hashing guards the layout
+        words = [self._ORDER_TYPEHASH]
+        for name, is_address in zip(self._ORDER_FIELD_NAMES, self._ORDER_FIELD_IS_ADDRESS):
+            value = order_payload[name]
+            if is_address:
+                words.append(bytes.fromhex(value[2:]).rjust(32, b"\x00"))
+            else:
+                # tokenId and expiration are strings in the API payload
+                words.append(int(value).to_bytes(32, "big"))
+        return keccak(b"".join(words))
+
+    def _verify_order_hashing(self):
+        """Check the hand-rolled EIP-712 hashing against eth_account once, so a mismatch fails loudly at startup"""
+        probe = self._create_order_payload_without_signature(
+            maker_address=self._account.address,
+            token_id=1,
+            maker_amount=1,
+            taker_amount=1,
+            fee_rate_bps=0,
+            side_flag=0
+        )
+        msg = {**probe, "tokenId": int(probe["tokenId"]), "expiration": int(probe["expiration"])}
+        expected = encode_typed_data(
+            domain_data=self._eip712_domain,
+            message_types=self._EIP712_ORDER_TYPES,
+            message_data=msg,
+        )
+        if expected.header != self._domain_separator or expected.body != self._order_struct_hash(probe):
+            raise RuntimeError("EIP-712 order hashing does not match eth_account, refusing to sign orders")
 
-        try:
-            encoded = encode_typed_data(
-                domain_data=domain,
-                message_types=self._EIP712_ORDER_TYPES,
-                message_data=msg,
-            )
-        except Exception:
-            encoded = encode_typed_data({
-                "types": self._EIP712_ORDER_TYPES,
-                "primaryType": "Order",
-                "domain": domain,
-                "message": msg,
-            })
-
-        acct = Account.from_key(self._private_key if self._private_key.startswith("0x") else "0x" + self._private_key)
-        signed = acct.sign_message(encoded)
-        sig = signed.signature.hex()
-        if not sig.startswith("0x"):
-            sig = "0x" + sig
-        return sig
-
-    def _create_order_api(self, order_payload, session_cookie):
-        headers = {
-            "cookie": f"limitless_session={session_cookie}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        self._logger.info(f"Order payload: {json.dumps(order_payload, indent=2)}")
-        r = self._gated_post('/orders', headers=headers, json=order_payload)
+    def _create_signature_for_order_payload(self, order_payload) -> str:
+        """Create EIP-712 signature for order, hashing against the precomputed domain separator"""
+        digest = keccak(b"\x19\x01" + self._domain_separator + self._order_struct_hash(order_payload))
+
+        sig = self._key_obj.sign_msg_hash(digest)
+        # eth_keys gives v as 0/1; Ethereum signatures carry 27/28
+        return "0x" + (sig.r.to_bytes(32, "big") + sig.s.to_bytes(32, "big") + bytes([sig.v + 27])).hex()
+
+    def _create_order_api(self, order_payload):
+        # Serialize once: the same bytes are logged and sent
+        body = fast_json.dumps(order_payload)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Order payload: %s", body.decode())
+        r = self._authed_request("POST", '/orders', headers=self._JSON_HEADERS, data=body)
         if r.status_code != 201:
             self._logger.error(f"Failed to create order. Status: {r.status_code}")
             self._logger.error(f"Response: {r.text}")
             raise Exception(f"API Error {r.status_code}: {r.text}")
-        out: CreateOrderResponseDTO = r.json()
-        self._logger.info(f"Order created successfully: {json.dumps(out, indent=2)}")
+        out: CreateOrderResponseDTO = fast_json.loads(r.content)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Order created successfully: %s", r.text)
         return out
 
+    @classmethod
+    def _buy_amounts(cls, price_micro: int, contracts: int) -> Tuple[int, int]:
+        """(maker, taker) for a BUY: pay collateral, receive contracts"""
+        return price_micro * contracts // cls._SCALING_FACTOR, contracts
+
+    @classmethod
+    def _sell_amounts(cls, price_micro: int, contracts: int, fee_bps: int) -> Tuple[int, int]:
+        """(maker, taker) for a SELL: give contracts net of fee, receive collateral"""
+        contracts_after = contracts * (10_000 - fee_bps) // 10_000
+        return contracts_after, price_micro * contracts_after // cls._SCALING_FACTOR
+
     def place_order(
         self,
         price_dollars: float,
@@ -309,67 +608,50 @@ class LimitlessProxy:
         side: Side,
         market_data: MarketData,
     ) -> CreateOrderResponseDTO:
-        if market_type not in get_args(self.Market):
+        if market_type not in ("YES", "NO"):
             raise ValueError("market_type must be 'YES' or 'NO'")
+        if side not in ("BUY", "SELL"):
+            raise ValueError("side must be 'BUY' or 'SELL'")
 
-        signing_message = self._get_signing_message()
-        session_cookie, user_data = self._login(signing_message)
-        self._logger.info("Logged in successfully")
+        session = self._get_session()
 
-        scaling_factor = 10 ** 6
         token_id = market_data.yes_token if market_type == "YES" else market_data.no_token
 
-        price = Decimal(str(price_dollars))
-        fee_bps = int(user_data.get("rank", {}).get("feeRateBps", 0))
-        fee = Decimal(fee_bps) / Decimal(10_000.0)
-        shares = int(shares)
+        # Integer math in collateral units (1e-6 USDC); prices are on a 0.001 tick so this is exact
+        price_micro = round(price_dollars * self._SCALING_FACTOR)
+        if abs(price_dollars * self._SCALING_FACTOR - price_micro) > 1e-3:
+            raise ValueError(f"price {price_dollars} is finer than 1e-6 and can't be expressed in collateral units")
+        contracts = int(shares) * self._SCALING_FACTOR
 
         if side == "BUY":
-            contracts_amount = shares * scaling_factor
-            collateral_amount = math.floor(price * Decimal(contracts_amount))
-
-            maker_amount = int(collateral_amount)
-            taker_amount = int(contracts_amount)
-
-        elif side == "SELL":
-            contracts_pre = shares * scaling_factor
-            contracts_after = math.floor(Decimal(contracts_pre) * (Decimal(1.0) - fee))
-            collateral_amount = math.floor(price * Decimal(contracts_after))
-
-            maker_amount = int(contracts_after)
-            taker_amount = int(collateral_amount)
-
+            side_flag = 0
+            maker_amount, taker_amount = self._buy_amounts(price_micro, contracts)
         else:
-            raise ValueError("side must be 'BUY' or 'SELL'")
+            side_flag = 1
+            maker_amount, taker_amount = self._sell_amounts(price_micro, contracts, session.fee_rate_bps)
 
         unsigned_order = self._create_order_payload_without_signature(
             maker_address=self._account.address,
             token_id=token_id,
             maker_amount=maker_amount,
             taker_amount=taker_amount,
-            fee_rate_bps=fee_bps,
-            side=side
+            fee_rate_bps=session.fee_rate_bps,
+            side_flag=side_flag
         )
         signature = self._create_signature_for_order_payload(unsigned_order)
 
         final_order_payload: CreateOrderBodyDTO = {
             "order": { **unsigned_order, "price": float(price_dollars), "signature": signature },
-            "ownerId": user_data["id"],
+            "ownerId": session.user_id,
             "orderType": "GTC",
             "marketSlug": market_data.slug,
         }
 
-        return self._create_order_api(final_order_payload, session_cookie)
+        return self._create_order_api(final_order_payload)
 
     def cancel_order(self, order_id: str) -> bool:
-        signing_message = self._get_signing_message()
-        session_cookie, user_data = self._login(signing_message)
-        headers = {
-            "cookie": f"limitless_session={session_cookie}",
-        }
-
-        self._logger.info(f"Canceling order with ID {order_id}")
-        r = self._gated_delete(f'/orders/{order_id}', headers=headers)
+        self._logger.info("Canceling order with ID %s", order_id)
+        r = self._authed_request("DELETE", f'/orders/{order_id}')
         if r.status_code == 200:
             self._logger.info("Order canceled successfully")
             return True
@@ -383,19 +665,31 @@ class LimitlessProxy:
 
         return False
 
+    def cancel_orders_batch(self, order_ids: List[str]) -> bool:
+        """
+        Cancel several orders in one request. Returns False if the server rejected the batch
+        (e.g. an unknown or already-closed id); raises HTTPError for 429/5xx left after retries.
+        """
+        self._logger.info("Canceling %d orders in batch: %s", len(order_ids), order_ids)
+        r = self._authed_request("POST", '/orders/cancel-batch', headers=self._JSON_HEADERS, data=fast_json.dumps({"orderIds": order_ids}))
+        if r.status_code in (200, 201):
+            self._logger.info("Orders canceled successfully")
+            return True
+        elif r.status_code == 401:
+            raise Exception("Not authorized to cancel these orders")
+        elif r.status_code == 429 or r.status_code >= 500:
+            r.raise_for_status()
+
+        self._logger.warning(f"Batch cancel failed with status {r.status_code}: {r.text}")
+        return False
+
     def check_order_filled(self, order_id: str) -> Optional[dict]:
         """Check if a specific order has been filled. Returns order data if filled, None otherwise."""
-        signing_message = self._get_signing_message()
-        session_cookie, user_data = self._login(signing_message)
-        headers = {
-            "cookie": f"limitless_session={session_cookie}",
-        }
-
         try:
-            r = self._gated_get(f'/orders/{order_id}', headers=headers)
+            r = self._authed_request("GET", f'/orders/{order_id}')
 
             if r.status_code == 200:
-                order_data = r.json()
+                order_data = fast_json.loads(r.content)
                 status = order_data.get("status", "").lower()
 
                 # Check if order is filled
@@ -413,24 +707,19 @@ class LimitlessProxy:
             return None
 
     def get_portfolio_history(self):
-        signing_message = self._get_signing_message()
-        session_cookie, user_data = self._login(signing_message)
-        headers = {
-            "cookie": f"limitless_session={session_cookie}",
-        }
-
-        r = self._gated_get("/portfolio/positions", headers=headers)
+        r = self._authed_request("GET", "/portfolio/positions")
         r.raise_for_status()
-        return r.json()
+        data: PortfolioHistoryDTO = fast_json.loads(r.content)
+        return data
 
     def get_orderbook(self, market_data: MarketData) -> OrderbookDTO:
         r = self._gated_get(f'/markets/{market_data.slug}/orderbook')
         r.raise_for_status()
-        data: OrderbookDTO = r.json()
-        return data
+        # strict=False tolerates numbers sent as strings
+        return msgspec.json.decode(r.content, type=OrderbookDTO, strict=False)
 
     def get_token_ids(self, slug: str) -> TokensDTO:
         r = self._gated_get(f'/markets/{slug}')
         r.raise_for_status()
-        tokens: TokensDTO = r.json()['tokens']
+        tokens: TokensDTO = fast_json.loads(r.content)['tokens']
         return tokens
@@ -8,7 +8,6 @@ from models.marketdata import MarketData
 from clients.limitless_client import LimitlessClient
 from datastreams.deribit_datastream import DeribitDatastream
 from datastreams.limitless_datastream import LimitlessDatastream
-from utils.snap import safe_snap_up, safe_snap_down
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +30,8 @@ class RewardFarmer:
         self._slug = market_data.slug
         self._yes_token = market_data.yes_token
         self._no_token = market_data.no_token
-        self._max_half_spread = Decimal(client.get_max_half_spread())
-        self._tick_size = Decimal(client.get_tick_size())
+        self._max_half_spread = Decimal(client.MAX_HALF_SPREAD)
+        self._tick_size = Decimal(client.TICK_SIZE)
         self._order_amount_usd = Decimal(order_amount_usd)
 
         self._bba_limit_ratio = Decimal('1.5')
@@ -259,48 +258,45 @@ class RewardFarmer:
 
         self._logger.debug(f"Inventory: Yes {yes_shares_inventory:.2f}, No {no_shares_inventory:.2f}")
 
+        # Decide every leg first, then send them together
+        orders = []
+
         sold_yes = False
         if yes_shares_to_sell <= yes_shares_inventory:
             order_yes_ask = float(yes_ask)
             self._logger.info(f"Selling YES: {yes_shares_to_sell} shares @ ${order_yes_ask:.3f}")
-            order_id = self._client.sell_yes(
-                order_yes_ask, yes_shares_to_sell, self._market_data
-            )
-            self._orders.append(order_id)
-            self._logger.debug(f"YES sell order placed with ID: {order_id}")
+            orders.append(('YES', 'SELL', order_yes_ask, yes_shares_to_sell))
             sold_yes = True
 
         sold_no = False
         if no_shares_to_sell <= no_shares_inventory:
             order_no_ask = float(no_ask)
             self._logger.info(f"Selling NO: {no_shares_to_sell} shares @ ${order_no_ask:.3f}")
-            order_id = self._client.sell_no(
-                order_no_ask, no_shares_to_sell, self._market_data
-            )
-            self._orders.append(order_id)
-            self._logger.debug(f"NO sell order placed with ID: {order_id}")
+            orders.append(('NO', 'SELL', order_no_ask, no_shares_to_sell))
             sold_no = True
 
-
-        yes_shares_to_sell = math.floor(self._order_amount_usd / yes_bid)
-        no_shares_to_sell = math.floor(self._order_amount_usd / no_bid)
         order_yes_bid = float(yes_bid)
         order_no_bid = float(no_bid)
 
         if not sold_no:
             self._logger.info(f"Buying YES: ${float(self._order_amount_usd):.2f} @ ${order_yes_bid:.3f}")
-            order_id = self._client.buy_yes(
-                order_yes_bid, float(self._order_amount_usd), self._market_data
-            )
-            self._orders.append(order_id)
-            self._logger.debug(f"YES buy order placed with ID: {order_id}")
+            orders.append(('YES', 'BUY', order_yes_bid, float(self._order_amount_usd)))
         if not sold_yes:
             self._logger.info(f"Buying NO: ${float(self._order_amount_usd):.2f} @ ${order_no_bid:.3f}")
-            order_id = self._client.buy_no(
-                order_no_bid, float(self._order_amount_usd), self._market_data
-            )
-            self._orders.append(order_id)
-            self._logger.debug(f"NO buy order placed with ID: {order_id}")
+            orders.append(('NO', 'BUY', order_no_bid, float(self._order_amount_usd)))
+
+        results = self._client.place_orders(orders, self._market_data)
+        errors = []
+        for (market_type, side, _, _), result in zip(orders, results):
+            if isinstance(result, Exception):
+                errors.append(result)
+                continue
+            self._orders.append(result)
+            self._logger.debug(f"{market_type} {side.lower()} order placed with ID: {result}")
+
+        # Legs that went through are tracked above, so they still get cancelled
+        if errors:
+            raise errors[0]
 
     def _cancel_orders(self):
         if self._orders:
@@ -0,0 +1,27 @@
+import threading
+import time
+from typing import Dict
+
+from models.constants import APPROVAL_CACHE_PATH, APPROVAL_CACHE_TTL
+from utils.json_file import load_json_dict, save_json_atomic
+
+
+class ApprovalCache:
+    """(owner, operator) -> time an ERC1155 approval was last seen on-chain, persisted to disk."""
+    def __init__(self, path: str = APPROVAL_CACHE_PATH, ttl_s: float = APPROVAL_CACHE_TTL):
+        self._path = path
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._seen: Dict[str, float] = load_json_dict(path) or {}
+
+    @staticmethod
+    def _key(owner: str, operator: str) -> str:
+        return f"{owner}:{operator}"
+
+    def is_fresh(self, owner: str, operator: str) -> bool:
+        return self._seen.get(self._key(owner, operator), 0.0) + self._ttl_s > time.time()
+
+    def mark(self, owner: str, operator: str):
+        with self._lock:
+            self._seen[self._key(owner, operator)] = time.time()
+            save_json_atomic(self._path, self._seen)
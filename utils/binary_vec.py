@@ -0,0 +1,66 @@
+import numpy as np
+from scipy.special import ndtr
+
+_SQRT_2PI = np.sqrt(2.0 * np.pi)
+
+
+def implied_volatilities(S, K, T, r, market_price, sigma_estimate=0.2, tolerance=1e-5, max_iterations=100):
+    """Vectorized Newton-Raphson implied volatility for European calls.
+
+    Same iteration as the scalar solver, run on whole arrays with converged entries frozen.
+    Entries that don't converge are NaN.
+    """
+    S, K, T, r, market_price = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, market_price))
+    )
+    sigma = np.full(S.shape, float(sigma_estimate))
+    result = np.full(S.shape, np.nan)
+    active = (S > 0) & (K > 0) & (T > 0)
+
+    with np.errstate(all='ignore'):
+        sqrt_t = np.sqrt(T)
+        log_moneyness = np.log(S / K)
+        discount = np.exp(-r * T)
+
+        for _ in range(max_iterations):
+            vol_t = sigma * sqrt_t
+            active &= vol_t != 0
+            if not active.any():
+                break
+
+            d1 = (log_moneyness + (r + 0.5 * sigma**2) * T) / vol_t
+            d2 = d1 - vol_t
+            price = S * ndtr(d1) - K * discount * ndtr(d2)
+            vega = S * sqrt_t * np.exp(-0.5 * d1**2) / _SQRT_2PI
+
+            # Avoid division by very small numbers
+            active &= ~(np.abs(vega) < 1e-10)
+
+            price_difference = market_price - price
+            sigma = np.where(active, sigma + price_difference / vega, sigma)
+
+            done = active & (np.abs(price_difference) < tolerance)
+            result[done] = sigma[done]
+            active &= ~done
+
+    return result
+
+
+def binary_prices(S, K, T, r, market_price):
+    """Binary call prices implied from vanilla call prices, for arrays of instruments.
+
+    Where the IV solve fails (often near expiry) the price falls back to 0.99/0.01
+    depending on moneyness.
+    """
+    S, K, T, r, market_price = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, market_price))
+    )
+    sigma = implied_volatilities(S, K, T, r, market_price)
+
+    with np.errstate(all='ignore'):
+        vol_t = sigma * np.sqrt(T)
+        d2 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_t - vol_t
+        prices = np.exp(-r * T) * ndtr(d2)
+
+    ok = ~np.isnan(sigma) & (vol_t != 0)
+    return np.where(ok, prices, np.where(S > K, 0.99, 0.01))
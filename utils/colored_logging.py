@@ -3,7 +3,10 @@ Colored logging utility for market-specific loggers.
 Provides colored console output and unique logger names for different strategies.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Dict, Optional
 from dataclasses import dataclass
@@ -126,7 +129,15 @@ class MarketLoggerManager:
         )
 
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+
+        # Emit through a queue so the trading threads never block on stdout. QueueHandler.prepare()
+        # still merges msg % args and any traceback on the calling thread; only the colored
+        # formatting and the stdout write happen on the listener thread
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, console_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         # Set level (will be overridden by root logger config)
         logger.setLevel(logging.DEBUG)
@@ -4,6 +4,15 @@ import math
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils import fast_json
+
+# One keep-alive pool for every fetcher, so all markets reuse the same connections to Deribit
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=16))
+# Bodies are pre-encoded with fast_json, so requests won't set this for us
+_SESSION.headers["Content-Type"] = "application/json"
 
 
 class DeribitOptionParams:
@@ -23,20 +32,42 @@ class DeribitOptionParams:
         self.base = self.TESTNET if testnet else self.MAINNET
         self.timeout = timeout
         self._next_id = 0
-        self._session = requests.Session()
+        self._session = _SESSION
+        self._instruments: Dict[str, Dict[str, Any]] = {}
 
     # ---------- Public ----------
 
     def get_params(self, instrument: str, r: float = 0.05) -> Dict[str, Any]:
-        ins = self._rpc("public/get_instrument", {"instrument_name": instrument})
+        ins = self.get_instrument(instrument)
+        tick = self._rpc("public/ticker", {"instrument_name": instrument})
+        return self.params_from_ticker(instrument, ins, tick, r=r)
+
+    def get_instrument(self, instrument: str) -> Dict[str, Any]:
+        """Instrument metadata (strike, expiry) never changes, so it is fetched once."""
+        ins = self._instruments.get(instrument)
+        if ins is None:
+            ins = self._rpc("public/get_instrument", {"instrument_name": instrument})
+            self._instruments[instrument] = ins
+        return ins
+
+    def params_from_ticker(
+        self,
+        instrument: str,
+        ins: Dict[str, Any],
+        tick: Dict[str, Any],
+        r: float = 0.05,
+        book_fallback: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build the params dict from instrument metadata and a ticker payload, which may come
+        from public/ticker or a ticker.* websocket notification.
+        """
         strike = float(ins.get("strike", ins.get("strike_price", 0.0)))
         expiry_ms = int(ins["expiration_timestamp"])
         expiry_dt = dt.datetime.fromtimestamp(expiry_ms / 1000.0, tz=dt.timezone.utc)
         expiry_str = expiry_dt.strftime("%Y-%m-%d")
         underlying = instrument.split("-", 1)[0] if "-" in instrument else ins.get("base_currency", "")
 
-        tick = self._rpc("public/ticker", {"instrument_name": instrument})
-
         S = self._to_float_safe(tick.get("underlying_price")) or self._to_float_safe(tick.get("index_price"))
         if S is None:
             raise RuntimeError(f"Missing underlying/index price in ticker for {instrument}: {tick}")
@@ -48,7 +79,7 @@ class DeribitOptionParams:
             self._to_float_safe(tick.get("mark_price"))
             or self._mid_from_ticker(tick)
             or self._to_float_safe(tick.get("last_price"))
-            or self._mid_from_order_book(instrument)
+            or (self._mid_from_order_book(instrument) if book_fallback else None)
         )
         if market_price_coin is None:
             raise RuntimeError(f"Could not determine market_price for {instrument}")
@@ -100,7 +131,7 @@ class DeribitOptionParams:
         self._next_id += 1
         payload = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
         try:
-            resp = self._session.post(self.base, json=payload, timeout=self.timeout)
+            resp = self._session.post(self.base, data=fast_json.dumps(payload), timeout=self.timeout)
             resp.raise_for_status()
         except requests.HTTPError as e:
             body = ""
@@ -110,7 +141,7 @@ class DeribitOptionParams:
                 pass
             raise RuntimeError(f"HTTP error during {method}: {e}{body}") from None
 
-        data = resp.json()
+        data = fast_json.loads(resp.content)
         if "error" in data and data["error"]:
             raise RuntimeError(f"RPC error for {method}: {data['error']}")
         result = data.get("result")
@@ -0,0 +1,109 @@
+import math
+import threading
+
+import numpy as np
+
+from utils.binary_vec import binary_prices
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _interp_target(S, K, T, r, mp, target_strike, target_time):
+    """Binary prices for four instruments and the interpolated target price.
+
+    Inputs are length-4 arrays ordered (lower_earlier, upper_earlier, lower_later, upper_later).
+    Returns (binary_prices, target_price).
+    """
+    sqrt_2 = math.sqrt(2.0)
+    sqrt_2pi = math.sqrt(2.0 * math.pi)
+    prices = np.empty(4)
+
+    for i in range(4):
+        s, k, t, rate, market_price = S[i], K[i], T[i], r[i], mp[i]
+
+        # Newton-Raphson implied volatility, same scheme as utils.implied_volatility
+        sigma = 0.2
+        converged = False
+        if s > 0.0 and k > 0.0 and t > 0.0:
+            sqrt_t = math.sqrt(t)
+            log_moneyness = math.log(s / k)
+            discount = math.exp(-rate * t)
+            for _ in range(100):
+                vol_t = sigma * sqrt_t
+                if vol_t == 0.0:
+                    break
+                d1 = (log_moneyness + (rate + 0.5 * sigma * sigma) * t) / vol_t
+                d2 = d1 - vol_t
+                call = s * 0.5 * math.erfc(-d1 / sqrt_2) - k * discount * 0.5 * math.erfc(-d2 / sqrt_2)
+                vega = s * sqrt_t * math.exp(-0.5 * d1 * d1) / sqrt_2pi
+                if abs(vega) < 1e-10:
+                    break
+                price_difference = market_price - call
+                sigma += price_difference / vega
+                if abs(price_difference) < 1e-5:
+                    converged = sigma * sqrt_t != 0.0
+                    break
+
+        if converged:
+            vol_t = sigma * math.sqrt(t)
+            d2 = (math.log(s / k) + (rate + 0.5 * sigma * sigma) * t) / vol_t - vol_t
+            prices[i] = math.exp(-rate * t) * 0.5 * math.erfc(-d2 / sqrt_2)
+        else:
+            # Fallback for when IV calculation fails (often near expiry)
+            prices[i] = 0.99 if s > k else 0.01
+
+    # Interpolate between strikes for each expiration
+    if K[0] == K[1]:
+        price_earlier = (prices[0] + prices[1]) / 2
+    else:
+        price_earlier = prices[0] + (prices[1] - prices[0]) / (K[1] - K[0]) * (target_strike - K[0])
+    if K[2] == K[3]:
+        price_later = (prices[2] + prices[3]) / 2
+    else:
+        price_later = prices[2] + (prices[3] - prices[2]) / (K[3] - K[2]) * (target_strike - K[2])
+
+    # Interpolate between expiration times
+    if T[0] == T[2]:
+        target_price = (price_earlier + price_later) / 2
+    else:
+        target_price = price_earlier + (price_later - price_earlier) / (T[2] - T[0]) * (target_time - T[0])
+
+    return prices, target_price
+
+
+if NUMBA_AVAILABLE:
+    _interp_target_jit = njit(cache=True)(_interp_target)
+    _jit_ready = threading.Event()
+
+    def _warmup():
+        ones = np.ones(4)
+        _interp_target_jit(ones, ones, ones, ones, ones, 1.0, 1.0)
+        _jit_ready.set()
+
+    # Compile (or load from cache) off the caller's thread; the NumPy
+    # version serves requests until it is ready
+    threading.Thread(target=_warmup, name="fast-binary-warmup", daemon=True).start()
+
+
+def _interpolate_target(prices, K, T, target_strike, target_time):
+    """Strike then expiration interpolation, for the non-JIT path"""
+    def interpolate(x_lo, y_lo, x_hi, y_hi, x):
+        if x_lo == x_hi:
+            return (y_lo + y_hi) / 2
+        return y_lo + (y_hi - y_lo) / (x_hi - x_lo) * (x - x_lo)
+
+    price_earlier = interpolate(K[0], prices[0], K[1], prices[1], target_strike)
+    price_later = interpolate(K[2], prices[2], K[3], prices[3], target_strike)
+    return interpolate(T[0], price_earlier, T[2], price_later, target_time)
+
+
+def interp_target(S, K, T, r, mp, target_strike, target_time):
+    """Compute binary prices and interpolated target price, using the JIT kernel when available"""
+    if NUMBA_AVAILABLE and _jit_ready.is_set():
+        return _interp_target_jit(S, K, T, r, mp, target_strike, target_time)
+    prices = binary_prices(S, K, T, r, mp)
+    return prices, _interpolate_target(prices, K, T, target_strike, target_time)
@@ -1,6 +1,8 @@
 import numpy as np
 from scipy.stats import norm
 
+from utils.binary_vec import implied_volatilities
+
 # Black-Scholes price of a European call option
 def bs_call_price(S, K, T, r, sigma):
     d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
@@ -12,25 +14,12 @@ def bs_vega(S, K, T, r, sigma):
     d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
     return S * np.sqrt(T) * norm.pdf(d1)
 
-# Newton-Raphson method for finding implied volatility
+# Newton-Raphson method for finding implied volatility (scalar wrapper around the vector solver)
 def find_implied_volatility(S, K, T, r, market_price, sigma_estimate=0.2, tolerance=1e-5, max_iterations=100):
-    sigma = sigma_estimate
-    for i in range(max_iterations):
-        price = bs_call_price(S, K, T, r, sigma)
-        vega = bs_vega(S, K, T, r, sigma)
-
-        # Avoid division by very small numbers
-        if abs(vega) < 1e-10:
-            break
-
-        price_difference = market_price - price
-        sigma += price_difference / vega  # Newton-Raphson update
-
-        if abs(price_difference) < tolerance:
-            return sigma
-
-    # If the loop completes without finding a root, raise an exception
-    raise ValueError("Implied volatility not found after maximum number of iterations")
+    sigma = implied_volatilities(S, K, T, r, market_price, sigma_estimate, tolerance, max_iterations)
+    if np.isnan(sigma):
+        raise ValueError("Implied volatility not found after maximum number of iterations")
+    return float(sigma)
 
 if __name__ == '__main__':
     # Example parameters
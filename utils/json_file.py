@@ -0,0 +1,32 @@
+import json
+import logging
+import os
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def load_json_dict(path: str) -> Optional[dict]:
+    """JSON object stored at path, or None if it is missing, unreadable or not an object"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save_json_atomic(path: str, data: Any, private: bool = False):
+    """
+    Write data as JSON via a temp file and os.replace, so readers never see a partial file.
+    private restricts the file to the current user. Failures are logged, not raised.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700 if private else 0o777, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600 if private else 0o666)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to persist {path}: {e}")
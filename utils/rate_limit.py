@@ -1,17 +1,31 @@
 import threading
 import time
 
-class SpacedLimiter:
-    """Serialize calls and enforce a minimum interval between starts."""
-    def __init__(self, min_interval_s: float = 5.0):
-        self.min_interval = float(min_interval_s)
+class TokenBucket:
+    """Allow bursts of up to `burst` calls, refilling at `rate_per_s` tokens per second."""
+    def __init__(self, rate_per_s: float, burst: int = 1):
+        self.rate = float(rate_per_s)
+        self.burst = float(burst)
         self._lock = threading.Lock()
-        self._last_start = 0.0  # monotonic seconds
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
 
     def acquire(self):
+        # Reserve a token under the lock (the balance may go negative), then sleep off
+        # the deficit outside it so concurrent callers queue without blocking each other
         with self._lock:
             now = time.monotonic()
-            wait = self.min_interval - (now - self._last_start)
-            if wait > 0:
-                time.sleep(wait)
-            self._last_start = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold off every caller for at least `seconds`, e.g. when the server asks us to back off."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
@@ -0,0 +1,32 @@
+import logging
+import os
+from typing import Optional
+
+from models.constants import SESSION_CACHE_DIR
+from utils.json_file import load_json_dict, save_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """Login session per account persisted to disk, so a restart can reuse an unexpired cookie."""
+    def __init__(self, directory: str = SESSION_CACHE_DIR):
+        self._dir = directory
+
+    def _path(self, public_key: str) -> str:
+        return os.path.join(self._dir, f"{public_key}.json")
+
+    def load(self, public_key: str) -> Optional[dict]:
+        return load_json_dict(self._path(public_key))
+
+    def save(self, public_key: str, session: dict):
+        # The cookie is a credential; keep it private to the user
+        save_json_atomic(self._path(public_key), session, private=True)
+
+    def delete(self, public_key: str):
+        try:
+            os.remove(self._path(public_key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove cached session for {public_key}: {e}")
@@ -0,0 +1,22 @@
+import threading
+from typing import Dict, Optional
+
+from models.constants import TOKEN_CACHE_PATH
+from models.limitless_response_types import TokensDTO
+from utils.json_file import load_json_dict, save_json_atomic
+
+
+class TokenCache:
+    """Slug -> token id map persisted to disk. Token ids never change for a market."""
+    def __init__(self, path: str = TOKEN_CACHE_PATH):
+        self._path = path
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, TokensDTO] = load_json_dict(path) or {}
+
+    def get(self, slug: str) -> Optional[TokensDTO]:
+        return self._tokens.get(slug)
+
+    def put(self, slug: str, tokens: TokensDTO):
+        with self._lock:
+            self._tokens[slug] = {'yes': tokens['yes'], 'no': tokens['no']}
+            save_json_atomic(self._path, self._tokens)